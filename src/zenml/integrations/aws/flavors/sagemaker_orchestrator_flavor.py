@@ -15,7 +15,7 @@
 
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
 
-from pydantic import Field, model_validator
+from pydantic import Field, PositiveFloat, PositiveInt, model_validator
 
 from zenml.config.base_settings import BaseSettings
 from zenml.integrations.aws import (
@@ -44,6 +44,23 @@ class SagemakerOrchestratorSettings(BaseSettings):
             orchestrator waits until all steps finish running. If `False`,
             the client returns immediately and the pipeline is executed
             asynchronously. Defaults to `True`.
+        polling_initial_delay_in_seconds: The delay in seconds before the
+            second status check while waiting for a synchronous pipeline
+            execution to finish.
+        polling_backoff_base: The factor by which the delay between two
+            status checks grows after each check while waiting for a
+            synchronous pipeline execution to finish. Must be at least 1.
+        polling_max_delay_in_seconds: The maximum delay in seconds between two
+            status checks while waiting for a synchronous pipeline execution to
+            finish. The delay between status checks grows exponentially until
+            it reaches this value.
+        polling_timeout_in_seconds: The maximum time in seconds to wait for a
+            synchronous pipeline execution to finish.
+        include_studio_url: Whether to add the URL of the pipeline execution
+            in SageMaker Studio to the run metadata. Computing this URL
+            requires looking up the Studio domain via the AWS API.
+        include_logs_url: Whether to add the URL of the pipeline execution
+            logs in CloudWatch to the run metadata.
         instance_type: The instance type to use for the processing job.
         execution_role: The IAM role to use for the step execution.
         processor_role: DEPRECATED: use `execution_role` instead.
@@ -105,6 +122,12 @@ class SagemakerOrchestratorSettings(BaseSettings):
     """
 
     synchronous: bool = True
+    polling_initial_delay_in_seconds: PositiveFloat = 2
+    polling_backoff_base: float = Field(default=2, ge=1)
+    polling_max_delay_in_seconds: PositiveFloat = 60
+    polling_timeout_in_seconds: PositiveFloat = 3000
+    include_studio_url: bool = True
+    include_logs_url: bool = True
 
     instance_type: Optional[str] = None
     execution_role: Optional[str] = None
@@ -207,6 +230,10 @@ class SagemakerOrchestratorConfig(
             from the job run. If not provided, a default bucket will be created
             based on the following format:
             "sagemaker-{region}-{aws-account-id}".
+        max_pool_connections: The maximum number of connections that the boto
+            clients of the orchestrator keep in their connection pool. Steps
+            are built in parallel, so this should be large enough to not block
+            concurrent requests to AWS.
     """
 
     execution_role: str
@@ -217,6 +244,7 @@ class SagemakerOrchestratorConfig(
     aws_auth_role_arn: Optional[str] = None
     region: Optional[str] = None
     bucket: Optional[str] = None
+    max_pool_connections: PositiveInt = 50
 
     @property
     def is_remote(self) -> bool:
@@ -13,12 +13,18 @@
 #  permissions and limitations under the License.
 """Implementation of the SageMaker orchestrator."""
 
+import json
 import os
+import random
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Optional,
@@ -30,12 +36,13 @@ from typing import (
 from uuid import UUID
 
 import boto3
-from botocore.exceptions import WaiterError
+from botocore.config import Config
 from sagemaker.estimator import Estimator
 from sagemaker.inputs import TrainingInput
 from sagemaker.network import NetworkConfig
 from sagemaker.processing import ProcessingInput, ProcessingOutput, Processor
 from sagemaker.session import Session
+from sagemaker.user_agent import get_user_agent_extra_suffix
 from sagemaker.workflow.entities import PipelineVariable
 from sagemaker.workflow.execution_variables import (
     ExecutionVariables,
@@ -76,6 +83,7 @@ from zenml.metadata.metadata_types import MetadataType, Uri
 from zenml.orchestrators import ContainerizedOrchestrator
 from zenml.orchestrators.utils import get_orchestrator_run_name
 from zenml.stack import StackValidator
+from zenml.utils import settings_utils
 from zenml.utils.env_utils import split_environment_variables
 from zenml.utils.time_utils import to_utc_timezone, utc_now_tz_aware
 
@@ -84,8 +92,37 @@ if TYPE_CHECKING:
     from zenml.stack import Stack
 
 ENV_ZENML_SAGEMAKER_RUN_ID = "ZENML_SAGEMAKER_RUN_ID"
-MAX_POLLING_ATTEMPTS = 100
-POLLING_DELAY = 30
+MAX_STEP_BUILDER_WORKERS = 32
+
+_ASSUMED_ROLE_ARN_REGEX = re.compile(
+    r"arn:aws:sts::(\d+):assumed-role/([^/]+)/.*"
+)
+_INVALID_PIPELINE_NAME_CHARACTERS_REGEX = re.compile(r"[^a-zA-Z0-9\-]")
+_TERMINAL_PIPELINE_EXECUTION_STATUSES = frozenset(
+    {"Succeeded", "Failed", "Stopped"}
+)
+_STUDIO_PIPELINE_EXECUTION_URL_TEMPLATE = (
+    "https://studio-{studio_domain_id}.studio.{region_name}."
+    "sagemaker.aws/pipelines/view/{pipeline_name}/executions"
+    "/{execution_id}/graph"
+)
+_CLOUDWATCH_LOGS_URL_TEMPLATE = (
+    "https://{region_name}.console.aws.amazon.com/"
+    "cloudwatch/home?region={region_name}#logsV2:log-groups/log-group"
+    "/$252Faws$252Fsagemaker$252F{job_type}Jobs$3FlogStreamNameFilter"
+    "$3Dpipelines-{execution_id}-"
+)
+# AWS cron expressions require 6 or 7 fields
+_VALID_CRON_FIELD_COUNTS = frozenset({6, 7})
+# Potential values:
+# https://docs.aws.amazon.com/sagemaker/latest/APIReference/API_DescribePipelineExecution.html
+_PIPELINE_EXECUTION_STATUS_MAPPING = {
+    "Executing": ExecutionStatus.RUNNING,
+    "Stopping": ExecutionStatus.RUNNING,
+    "Stopped": ExecutionStatus.FAILED,
+    "Failed": ExecutionStatus.FAILED,
+    "Succeeded": ExecutionStatus.COMPLETED,
+}
 
 logger = get_logger(__name__)
 
@@ -105,18 +142,20 @@ def dissect_schedule_arn(
         ValueError: If the input is not a properly formatted ARN.
     """
     # Split the ARN into parts
-    arn_parts = schedule_arn.split(":")
+    arn_parts = schedule_arn.split(":", 5)
 
     # Validate ARN structure
-    if len(arn_parts) < 6 or not arn_parts[5].startswith("schedule/"):
+    if len(arn_parts) < 6:
+        raise ValueError("Invalid EventBridge schedule ARN format.")
+
+    # Extract the group name and schedule name
+    prefix, separator, name = arn_parts[5].partition("schedule/")
+    if prefix or not separator:
         raise ValueError("Invalid EventBridge schedule ARN format.")
 
     # Extract the region
     region = arn_parts[3]
 
-    # Extract the group name and schedule name
-    name = arn_parts[5].split("schedule/")[1]
-
     return region, name
 
 
@@ -125,25 +164,29 @@ def dissect_pipeline_execution_arn(
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Extract region name, pipeline name, and execution id from the ARN.
 
+    Pipeline execution ARNs have the fixed format
+    `arn:aws:sagemaker:<REGION>:<ACCOUNT>:pipeline/<NAME>/execution/<ID>`.
+
     Args:
         pipeline_execution_arn: the pipeline execution ARN
 
     Returns:
         Region Name, Pipeline Name, Execution ID in order
     """
+    arn_parts = pipeline_execution_arn.split(":", 5)
+    if len(arn_parts) < 6:
+        return None, None, None
+
     # Extract region_name
-    region_match = re.search(r"sagemaker:(.*?):", pipeline_execution_arn)
-    region_name = region_match.group(1) if region_match else None
+    region_name = arn_parts[3] if arn_parts[2] == "sagemaker" else None
 
-    # Extract pipeline_name
-    pipeline_match = re.search(
-        r"pipeline/(.*?)/execution", pipeline_execution_arn
+    # Extract pipeline_name and execution_id
+    _, pipeline_separator, resource = arn_parts[5].partition("pipeline/")
+    pipeline_name, execution_separator, execution_id = resource.partition(
+        "/execution/"
     )
-    pipeline_name = pipeline_match.group(1) if pipeline_match else None
-
-    # Extract execution_id
-    execution_match = re.search(r"execution/(.*)", pipeline_execution_arn)
-    execution_id = execution_match.group(1) if execution_match else None
+    if not pipeline_separator or not execution_separator:
+        return region_name, None, None
 
     return region_name, pipeline_name, execution_id
 
@@ -151,6 +194,11 @@ def dissect_pipeline_execution_arn(
 class SagemakerOrchestrator(ContainerizedOrchestrator):
     """Orchestrator responsible for running pipelines on Sagemaker."""
 
+    _session: Optional[Session] = None
+    _session_expires_at: Optional[datetime] = None
+    _sts_client: Optional[Any] = None
+    _studio_domain_id: Optional[str] = None
+
     @property
     def config(self) -> SagemakerOrchestratorConfig:
         """Returns the `SagemakerOrchestratorConfig` config.
@@ -174,20 +222,25 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
         def _validate_remote_components(
             stack: "Stack",
         ) -> Tuple[bool, str]:
-            for component in stack.components.values():
-                if not component.config.is_local:
-                    continue
-
-                return False, (
-                    f"The Sagemaker orchestrator runs pipelines remotely, "
-                    f"but the '{component.name}' {component.type.value} is "
-                    "a local stack component and will not be available in "
-                    "the Sagemaker step.\nPlease ensure that you always "
-                    "use non-local stack components with the Sagemaker "
-                    "orchestrator."
-                )
-
-            return True, ""
+            local_component = next(
+                (
+                    component
+                    for component in stack.components.values()
+                    if component.config.is_local
+                ),
+                None,
+            )
+            if local_component is None:
+                return True, ""
+
+            return False, (
+                f"The Sagemaker orchestrator runs pipelines remotely, "
+                f"but the '{local_component.name}' "
+                f"{local_component.type.value} is a local stack component "
+                "and will not be available in the Sagemaker step.\nPlease "
+                "ensure that you always use non-local stack components with "
+                "the Sagemaker orchestrator."
+            )
 
         return StackValidator(
             required_components={
@@ -229,6 +282,10 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
     def _get_sagemaker_session(self) -> Session:
         """Method to create the sagemaker session with proper authentication.
 
+        The session is cached on the orchestrator instance and only recreated
+        if the linked connector has expired or if the credentials of an
+        assumed role are about to expire.
+
         Returns:
             The Sagemaker Session.
 
@@ -236,9 +293,23 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
             RuntimeError: If the connector returns the wrong type for the
                 session.
         """
+        # Refresh the session also if the connector or the assumed role
+        # credentials have expired
+        if (
+            self._session is not None
+            and not self.connector_has_expired()
+            and (
+                self._session_expires_at is None
+                or utc_now_tz_aware() + timedelta(minutes=5)
+                < self._session_expires_at
+            )
+        ):
+            return self._session
+
         # Get authenticated session
         # Option 1: Service connector
         boto_session: boto3.Session
+        session_expires_at: Optional[datetime] = None
         if connector := self.get_connector():
             boto_session = connector.connect()
             if not isinstance(boto_session, boto3.Session):
@@ -269,9 +340,60 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                     aws_session_token=credentials["SessionToken"],
                     region_name=self.config.region,
                 )
-        return Session(
-            boto_session=boto_session, default_bucket=self.config.bucket
+                session_expires_at = credentials.get("Expiration")
+
+        self._session = Session(
+            boto_session=boto_session,
+            sagemaker_client=boto_session.client(
+                "sagemaker",
+                config=self._get_boto_client_config().merge(
+                    # Keep the SageMaker SDK specific user agent suffix that
+                    # the SDK would add to its default client
+                    Config(user_agent_extra=get_user_agent_extra_suffix())  # type: ignore[no-untyped-call]
+                ),
+            ),
+            default_bucket=self.config.bucket,
         )
+        self._session_expires_at = session_expires_at
+        self._sts_client = None
+        return self._session
+
+    def _get_boto_client_config(self) -> Config:
+        """Gets the configuration for the boto clients used by the orchestrator.
+
+        Returns:
+            The boto client configuration.
+        """
+        return Config(
+            max_pool_connections=self.config.max_pool_connections,
+            retries={"mode": "adaptive", "max_attempts": 10},
+            tcp_keepalive=True,
+        )
+
+    @property
+    def sagemaker_client(self) -> Any:
+        """The SageMaker client of the authenticated SageMaker session.
+
+        Returns:
+            The SageMaker client.
+        """
+        return self._get_sagemaker_session().sagemaker_client
+
+    @property
+    def sts_client(self) -> Any:
+        """The STS client of the authenticated SageMaker session.
+
+        Returns:
+            The STS client.
+        """
+        # Accessing the session first resets the client if the session
+        # needed to be refreshed
+        session = self._get_sagemaker_session()
+        if self._sts_client is None:
+            self._sts_client = session.boto_session.client(
+                "sts", config=self._get_boto_client_config()
+            )
+        return self._sts_client
 
     def prepare_or_run_pipeline(
         self,
@@ -304,8 +426,8 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
             pipeline_name=deployment.pipeline_configuration.name
         )
         # replace all non-alphanum and non-hyphens with hyphens
-        orchestrator_run_name = re.sub(
-            r"[^a-zA-Z0-9\-]", "-", unsanitized_orchestrator_run_name
+        orchestrator_run_name = _INVALID_PIPELINE_NAME_CHARACTERS_REGEX.sub(
+            "-", unsanitized_orchestrator_run_name
         )
 
         session = self._get_sagemaker_session()
@@ -320,74 +442,155 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
             env=environment,
         )
 
-        sagemaker_steps = []
-        for step_name, step in deployment.step_configurations.items():
-            image = self.get_image(deployment=deployment, step_name=step_name)
-            command = SagemakerEntrypointConfiguration.get_entrypoint_command()
-            arguments = (
-                SagemakerEntrypointConfiguration.get_entrypoint_arguments(
-                    step_name=step_name, deployment_id=deployment.id
-                )
+        # Values that are the same for all steps
+        command = SagemakerEntrypointConfiguration.get_entrypoint_command()
+        deployment_id = deployment.id
+        config = self.config
+        default_use_training_step = (
+            config.use_training_step
+            if config.use_training_step is not None
+            else True
+        )
+        default_execution_role = config.execution_role
+
+        step_configurations = deployment.step_configurations
+
+        # Steps usually share the same settings, so we only validate each
+        # distinct set of step settings once. This happens before the steps
+        # are built in parallel, so the builder threads only read them.
+        settings_key = settings_utils.get_stack_component_setting_key(self)
+        step_settings_cache: Dict[str, SagemakerOrchestratorSettings] = {}
+        all_step_settings: Dict[str, SagemakerOrchestratorSettings] = {}
+        for step_name, step in step_configurations.items():
+            raw_step_settings = step.config.settings.get(settings_key)
+            settings_cache_key = (
+                raw_step_settings.model_dump_json()
+                if raw_step_settings
+                else ""
             )
-            entrypoint = command + arguments
+            if settings_cache_key not in step_settings_cache:
+                step_settings_cache[settings_cache_key] = cast(
+                    SagemakerOrchestratorSettings, self.get_settings(step)
+                )
+            all_step_settings[step_name] = step_settings_cache[
+                settings_cache_key
+            ]
 
-            step_settings = cast(
-                SagemakerOrchestratorSettings, self.get_settings(step)
+        def _uses_training_step(
+            step_settings: SagemakerOrchestratorSettings,
+        ) -> bool:
+            """Checks whether a step runs as a training step.
+
+            Args:
+                step_settings: The settings of the step.
+
+            Returns:
+                Whether the step runs as a training step.
+            """
+            if step_settings.use_training_step is not None:
+                return step_settings.use_training_step
+            return default_use_training_step
+
+        # Convert network_config to sagemaker.network.NetworkConfig if
+        # present. Steps usually share the same network config, so we only
+        # convert each distinct network config once.
+        network_configs: Dict[str, NetworkConfig] = {}
+        step_network_configs: Dict[str, NetworkConfig] = {}
+        for step_name, step_settings in all_step_settings.items():
+            network_config = (
+                step_settings.estimator_args
+                if _uses_training_step(step_settings)
+                else step_settings.processor_args
+            ).get("network_config")
+            if not network_config or not isinstance(network_config, dict):
+                continue
+
+            network_config_key = json.dumps(
+                network_config, sort_keys=True, default=str
             )
+            if network_config_key not in network_configs:
+                try:
+                    network_configs[network_config_key] = NetworkConfig(
+                        **network_config
+                    )
+                except TypeError:
+                    # If the network_config passed is not compatible with
+                    # the NetworkConfig class, raise a more informative
+                    # error.
+                    raise TypeError(
+                        "Expected a sagemaker.network.NetworkConfig "
+                        "compatible object for the network_config "
+                        "argument, but the network_config processor "
+                        "argument is invalid."
+                        "See https://sagemaker.readthedocs.io/en/stable/api/utility/network.html#sagemaker.network.NetworkConfig "
+                        "for more information about the NetworkConfig "
+                        "class."
+                    )
+            step_network_configs[step_name] = network_configs[
+                network_config_key
+            ]
 
-            if step_settings.environment:
+        # Steps usually share the same environment settings, so we only split
+        # each distinct step environment once.
+        split_step_environments: Dict[
+            FrozenSet[Tuple[str, str]], Dict[str, str]
+        ] = {}
+        step_environments: Dict[str, Dict[str, str]] = {}
+        for step_name, step_settings in all_step_settings.items():
+            if not step_settings.environment:
+                step_environments[step_name] = environment
+                continue
+
+            environment_key = frozenset(step_settings.environment.items())
+            if environment_key not in split_step_environments:
                 split_environment = step_settings.environment.copy()
-                # Sagemaker does not allow environment variables longer than 256
-                # characters to be passed to Processor steps. If an environment variable
-                # is longer than 256 characters, we split it into multiple environment
-                # variables (chunks) and re-construct it on the other side using the
-                # custom entrypoint configuration.
+                # Sagemaker does not allow environment variables longer than
+                # 256 characters to be passed to Processor steps. If an
+                # environment variable is longer than 256 characters, we split
+                # it into multiple environment variables (chunks) and
+                # re-construct it on the other side using the custom
+                # entrypoint configuration.
                 split_environment_variables(
                     size_limit=SAGEMAKER_PROCESSOR_STEP_ENV_VAR_SIZE_LIMIT,
                     env=split_environment,
                 )
-                environment.update(split_environment)
-
-            use_training_step = (
-                step_settings.use_training_step
-                if step_settings.use_training_step is not None
-                else (
-                    self.config.use_training_step
-                    if self.config.use_training_step is not None
-                    else True
-                )
-            )
+                split_step_environments[environment_key] = {
+                    **environment,
+                    **split_environment,
+                }
+            step_environments[step_name] = split_step_environments[
+                environment_key
+            ]
 
-            # Retrieve Executor arguments provided in the Step settings.
-            if use_training_step:
-                args_for_step_executor = step_settings.estimator_args or {}
-                args_for_step_executor.setdefault(
-                    "volume_size", step_settings.volume_size_in_gb
-                )
-                args_for_step_executor.setdefault(
-                    "max_run", step_settings.max_runtime_in_seconds
-                )
-            else:
-                args_for_step_executor = step_settings.processor_args or {}
-                args_for_step_executor.setdefault(
-                    "volume_size_in_gb", step_settings.volume_size_in_gb
-                )
-                args_for_step_executor.setdefault(
-                    "max_runtime_in_seconds",
-                    step_settings.max_runtime_in_seconds,
-                )
+        def _build_sagemaker_step(step_name: str) -> Step:
+            """Builds the SageMaker step for a ZenML step.
+
+            Args:
+                step_name: The name of the step.
 
-            # Set default values from configured orchestrator Component to
-            # arguments to be used when they are not present in processor_args.
-            args_for_step_executor.setdefault(
-                "role",
-                step_settings.execution_role or self.config.execution_role,
+            Returns:
+                The SageMaker step.
+            """
+            step = step_configurations[step_name]
+            image = self.get_image(deployment=deployment, step_name=step_name)
+            arguments = (
+                SagemakerEntrypointConfiguration.get_entrypoint_arguments(
+                    step_name=step_name, deployment_id=deployment_id
+                )
             )
+            entrypoint = [*command, *arguments]
+            step_settings = all_step_settings[step_name]
+
+            use_training_step = _uses_training_step(step_settings)
 
             tags = step_settings.tags
-            args_for_step_executor.setdefault(
-                "tags",
-                (
+
+            # Default values from the configured orchestrator component and
+            # the step settings, used when they are not present in the
+            # Executor arguments provided in the step settings.
+            default_args: Dict[str, Any] = {
+                "role": step_settings.execution_role or default_execution_role,
+                "tags": (
                     [
                         {"Key": key, "Value": value}
                         for key, value in tags.items()
@@ -395,37 +598,37 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                     if tags
                     else None
                 ),
-            )
-
-            args_for_step_executor.setdefault(
-                "instance_type", step_settings.instance_type
-            )
-
-            # Set values that cannot be overwritten
-            args_for_step_executor["image_uri"] = image
-            args_for_step_executor["instance_count"] = 1
-            args_for_step_executor["sagemaker_session"] = session
-            args_for_step_executor["base_job_name"] = orchestrator_run_name
-
-            # Convert network_config to sagemaker.network.NetworkConfig if
-            # present
-            network_config = args_for_step_executor.get("network_config")
+                "instance_type": step_settings.instance_type,
+            }
+            if use_training_step:
+                default_args["volume_size"] = step_settings.volume_size_in_gb
+                default_args["max_run"] = step_settings.max_runtime_in_seconds
+                step_executor_args = step_settings.estimator_args
+            else:
+                default_args["volume_size_in_gb"] = (
+                    step_settings.volume_size_in_gb
+                )
+                default_args["max_runtime_in_seconds"] = (
+                    step_settings.max_runtime_in_seconds
+                )
+                step_executor_args = step_settings.processor_args
+
+            # The settings might be shared with other steps, so we always
+            # merge into a new dictionary
+            args_for_step_executor: Dict[str, Any] = {
+                **default_args,
+                **step_executor_args,
+                # Set values that cannot be overwritten
+                "image_uri": image,
+                "instance_count": 1,
+                "sagemaker_session": session,
+                "base_job_name": orchestrator_run_name,
+            }
 
-            if network_config and isinstance(network_config, dict):
-                try:
-                    args_for_step_executor["network_config"] = NetworkConfig(
-                        **network_config
-                    )
-                except TypeError:
-                    # If the network_config passed is not compatible with the
-                    # NetworkConfig class, raise a more informative error.
-                    raise TypeError(
-                        "Expected a sagemaker.network.NetworkConfig "
-                        "compatible object for the network_config argument, "
-                        "but the network_config processor argument is invalid."
-                        "See https://sagemaker.readthedocs.io/en/stable/api/utility/network.html#sagemaker.network.NetworkConfig "
-                        "for more information about the NetworkConfig class."
-                    )
+            if step_name in step_network_configs:
+                args_for_step_executor["network_config"] = (
+                    step_network_configs[step_name]
+                )
 
             # Construct S3 inputs to container for step
             training_inputs: Optional[
@@ -451,28 +654,22 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                     ]
             elif isinstance(step_settings.input_data_s3_uri, dict):
                 if use_training_step:
-                    training_inputs = {}
-                    for (
-                        channel,
-                        s3_uri,
-                    ) in step_settings.input_data_s3_uri.items():
-                        training_inputs[channel] = TrainingInput(
+                    training_inputs = {
+                        channel: TrainingInput(
                             s3_data=s3_uri,
                             input_mode=step_settings.input_data_s3_mode,
                         )
+                        for channel, s3_uri in step_settings.input_data_s3_uri.items()
+                    }
                 else:
-                    processing_inputs = []
-                    for (
-                        channel,
-                        s3_uri,
-                    ) in step_settings.input_data_s3_uri.items():
-                        processing_inputs.append(
-                            ProcessingInput(
-                                source=s3_uri,
-                                destination=f"/opt/ml/processing/input/data/{channel}",
-                                s3_input_mode=step_settings.input_data_s3_mode,
-                            )
+                    processing_inputs = [
+                        ProcessingInput(
+                            source=s3_uri,
+                            destination=f"/opt/ml/processing/input/data/{channel}",
+                            s3_input_mode=step_settings.input_data_s3_mode,
                         )
+                        for channel, s3_uri in step_settings.input_data_s3_uri.items()
+                    ]
 
             # Construct S3 outputs from container for step
             outputs = None
@@ -492,24 +689,20 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                         )
                     ]
             elif isinstance(step_settings.output_data_s3_uri, dict):
-                outputs = []
-                for (
-                    channel,
-                    s3_uri,
-                ) in step_settings.output_data_s3_uri.items():
-                    outputs.append(
-                        ProcessingOutput(
-                            source=f"/opt/ml/processing/output/data/{channel}",
-                            destination=s3_uri,
-                            s3_upload_mode=step_settings.output_data_s3_mode,
-                        )
+                outputs = [
+                    ProcessingOutput(
+                        source=f"/opt/ml/processing/output/data/{channel}",
+                        destination=s3_uri,
+                        s3_upload_mode=step_settings.output_data_s3_mode,
                     )
+                    for channel, s3_uri in step_settings.output_data_s3_uri.items()
+                ]
 
             step_environment: Dict[str, Union[str, PipelineVariable]] = {
-                key: str(value)
-                if not isinstance(value, PipelineVariable)
-                else value
-                for key, value in environment.items()
+                key: value
+                if isinstance(value, (str, PipelineVariable))
+                else str(value)
+                for key, value in step_environments[step_name].items()
             }
 
             step_environment[ENV_ZENML_SAGEMAKER_RUN_ID] = (
@@ -558,7 +751,21 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                     outputs=outputs,
                 )
 
-            sagemaker_steps.append(sagemaker_step)
+            return sagemaker_step
+
+        # The steps are independent of each other, so we build them in
+        # parallel. The Estimator/Processor constructors might perform
+        # blocking calls to AWS using the shared session. Everything the
+        # steps share was resolved above, so the builder threads only read
+        # from these dictionaries.
+        with ThreadPoolExecutor(
+            max_workers=min(
+                MAX_STEP_BUILDER_WORKERS, max(1, len(step_configurations))
+            )
+        ) as executor:
+            sagemaker_steps = list(
+                executor.map(_build_sagemaker_step, step_configurations)
+            )
 
         # Create the pipeline
         pipeline = Pipeline(
@@ -572,7 +779,7 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
         )
 
         pipeline.create(
-            role_arn=self.config.execution_role,
+            role_arn=default_execution_role,
             tags=[
                 {"Key": key, "Value": value}
                 for key, value in settings.pipeline_tags.items()
@@ -654,7 +861,7 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                     "No scheduler_role configured. Trying to extract it from "
                     "the client side authentication."
                 )
-                sts = session.boto_session.client("sts")
+                sts = self.sts_client
                 try:
                     scheduler_role_arn = sts.get_caller_identity()["Arn"]
                     # If this is a user ARN, try to get the role ARN
@@ -670,8 +877,7 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                         # Convert assumed-role ARN format to role ARN format
                         # From: arn:aws:sts::123456789012:assumed-role/role-name/session-name
                         # To: arn:aws:iam::123456789012:role/role-name
-                        scheduler_role_arn = re.sub(
-                            r"arn:aws:sts::(\d+):assumed-role/([^/]+)/.*",
+                        scheduler_role_arn = _ASSUMED_ROLE_ARN_REGEX.sub(
                             r"arn:aws:iam::\1:role/\2",
                             scheduler_role_arn,
                         )
@@ -762,7 +968,9 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                 execution_arn=execution.arn, settings=settings
             )
 
-            # mainly for testing purposes, we wait for the pipeline to finish
+            # mainly for testing purposes, we wait for the pipeline to finish.
+            # Runs triggered by the ZenML server are always asynchronous, so
+            # this blocking wait only ever happens in client processes.
             if settings.synchronous:
                 logger.info(
                     "Executing synchronously. Waiting for pipeline to "
@@ -770,20 +978,64 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                     "At this point you can `Ctrl-C` out without cancelling the "
                     "execution."
                 )
-                try:
-                    execution.wait(
-                        delay=POLLING_DELAY, max_attempts=MAX_POLLING_ATTEMPTS
-                    )
-                    logger.info("Pipeline completed successfully.")
-                except WaiterError:
+                status = self._wait_for_pipeline_execution(
+                    execution_arn=execution.arn, settings=settings
+                )
+                if status != "Succeeded":
                     raise RuntimeError(
-                        "Timed out while waiting for pipeline execution to "
-                        "finish. For long-running pipelines we recommend "
-                        "configuring your orchestrator for asynchronous "
-                        "execution. The following command does this for you: \n"
-                        f"`zenml orchestrator update {self.name} "
-                        f"--synchronous=False`"
+                        f"Pipeline execution finished with status `{status}`."
                     )
+                logger.info("Pipeline completed successfully.")
+
+    def _wait_for_pipeline_execution(
+        self,
+        execution_arn: str,
+        settings: SagemakerOrchestratorSettings,
+    ) -> str:
+        """Waits until a pipeline execution reaches a terminal status.
+
+        The delay between two status checks grows exponentially, so that short
+        pipelines are picked up quickly while long-running pipelines don't
+        issue unnecessary API calls. The delay is randomly jittered to spread
+        out the requests of concurrently waiting clients.
+
+        Args:
+            execution_arn: The ARN of the pipeline execution.
+            settings: The Sagemaker orchestrator settings.
+
+        Returns:
+            The terminal status of the pipeline execution.
+
+        Raises:
+            RuntimeError: If the pipeline execution did not finish in time.
+        """
+        sagemaker_client = self.sagemaker_client
+        deadline = time.monotonic() + settings.polling_timeout_in_seconds
+        delay = settings.polling_initial_delay_in_seconds
+
+        while True:
+            status = sagemaker_client.describe_pipeline_execution(
+                PipelineExecutionArn=execution_arn
+            )["PipelineExecutionStatus"]
+            if status in _TERMINAL_PIPELINE_EXECUTION_STATUSES:
+                return cast(str, status)
+
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                raise RuntimeError(
+                    "Timed out while waiting for pipeline execution to "
+                    "finish. For long-running pipelines we recommend "
+                    "configuring your orchestrator for asynchronous "
+                    "execution. The following command does this for you: \n"
+                    f"`zenml orchestrator update {self.name} "
+                    f"--synchronous=False`"
+                )
+
+            time.sleep(min(remaining_time, delay * random.uniform(0.5, 1)))
+            delay = min(
+                settings.polling_max_delay_in_seconds,
+                delay * settings.polling_backoff_base,
+            )
 
     def get_pipeline_run_metadata(
         self, run_id: UUID
@@ -796,22 +1048,21 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
         Returns:
             A dictionary of metadata.
         """
-        execution_arn = os.environ[ENV_ZENML_SAGEMAKER_RUN_ID]
-
-        run_metadata: Dict[str, "MetadataType"] = {}
+        execution_arn = self.get_orchestrator_run_id()
 
         settings = cast(
             SagemakerOrchestratorSettings,
             self.get_settings(Client().get_pipeline_run(run_id)),
         )
 
-        for metadata in self.compute_metadata(
-            execution_arn=execution_arn,
-            settings=settings,
-        ):
-            run_metadata.update(metadata)
-
-        return run_metadata
+        # `compute_metadata` yields all the metadata in a single dictionary
+        return next(
+            self.compute_metadata(
+                execution_arn=execution_arn,
+                settings=settings,
+            ),
+            {},
+        )
 
     def fetch_status(self, run: "PipelineRunResponse") -> ExecutionStatus:
         """Refreshes the status of a specific pipeline run.
@@ -840,10 +1091,6 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
             == run.stack.components[StackComponentType.ORCHESTRATOR][0].id
         )
 
-        # Initialize the Sagemaker client
-        session = self._get_sagemaker_session()
-        sagemaker_client = session.sagemaker_client
-
         # Fetch the status of the _PipelineExecution
         if METADATA_ORCHESTRATOR_RUN_ID in run.run_metadata:
             run_id = run.run_metadata[METADATA_ORCHESTRATOR_RUN_ID]
@@ -854,19 +1101,15 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
                 "Can not find the orchestrator run ID, thus can not fetch "
                 "the status."
             )
-        status = sagemaker_client.describe_pipeline_execution(
+
+        status = self.sagemaker_client.describe_pipeline_execution(
             PipelineExecutionArn=run_id
         )["PipelineExecutionStatus"]
 
-        # Map the potential outputs to ZenML ExecutionStatus. Potential values:
-        # https://cloud.google.com/vertex-ai/docs/reference/rest/v1beta1/PipelineState
-        if status in ["Executing", "Stopping"]:
-            return ExecutionStatus.RUNNING
-        elif status in ["Stopped", "Failed"]:
-            return ExecutionStatus.FAILED
-        elif status in ["Succeeded"]:
-            return ExecutionStatus.COMPLETED
-        else:
+        # Map the potential outputs to ZenML ExecutionStatus.
+        try:
+            return _PIPELINE_EXECUTION_STATUS_MAPPING[status]
+        except KeyError:
             raise ValueError("Unknown status for the pipeline execution.")
 
     def compute_metadata(
@@ -889,50 +1132,71 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
             METADATA_ORCHESTRATOR_RUN_ID: execution_arn,
         }
 
+        region_name, pipeline_name, execution_id = (
+            dissect_pipeline_execution_arn(execution_arn)
+        )
+
         # URL to the Sagemaker's pipeline view
-        if orchestrator_url := self._compute_orchestrator_url(
-            execution_arn=execution_arn
+        if settings.include_studio_url and (
+            orchestrator_url := self._compute_orchestrator_url(
+                region_name=region_name,
+                pipeline_name=pipeline_name,
+                execution_id=execution_id,
+            )
         ):
             metadata[METADATA_ORCHESTRATOR_URL] = Uri(orchestrator_url)
 
         # URL to the corresponding CloudWatch page
-        if logs_url := self._compute_orchestrator_logs_url(
-            execution_arn=execution_arn, settings=settings
+        if settings.include_logs_url and (
+            logs_url := self._compute_orchestrator_logs_url(
+                region_name=region_name,
+                execution_id=execution_id,
+                settings=settings,
+            )
         ):
             metadata[METADATA_ORCHESTRATOR_LOGS_URL] = Uri(logs_url)
 
         yield metadata
 
+    def _get_studio_domain_id(self) -> str:
+        """Gets the ID of the SageMaker Studio domain.
+
+        The domain ID doesn't change for an AWS account and region, so it is
+        cached on the orchestrator instance after the first lookup.
+
+        Returns:
+            The ID of the SageMaker Studio domain.
+        """
+        if self._studio_domain_id is None:
+            # List the Studio domains and get the Studio Domain ID
+            domains_response = self.sagemaker_client.list_domains()
+            self._studio_domain_id = domains_response["Domains"][0]["DomainId"]
+        return self._studio_domain_id
+
     def _compute_orchestrator_url(
         self,
-        execution_arn: Any,
+        region_name: Optional[str],
+        pipeline_name: Optional[str],
+        execution_id: Optional[str],
     ) -> Optional[str]:
         """Generate the Orchestrator Dashboard URL upon pipeline execution.
 
         Args:
-            execution_arn: The ARN of the pipeline execution.
+            region_name: The region of the pipeline execution.
+            pipeline_name: The name of the pipeline.
+            execution_id: The ID of the pipeline execution.
 
         Returns:
              the URL to the dashboard view in SageMaker.
         """
         try:
-            (
-                region_name,
-                pipeline_name,
-                execution_id,
-            ) = dissect_pipeline_execution_arn(execution_arn)
+            studio_domain_id = self._get_studio_domain_id()
 
-            # Get the Sagemaker session
-            session = self._get_sagemaker_session()
-
-            # List the Studio domains and get the Studio Domain ID
-            domains_response = session.sagemaker_client.list_domains()
-            studio_domain_id = domains_response["Domains"][0]["DomainId"]
-
-            return (
-                f"https://studio-{studio_domain_id}.studio.{region_name}."
-                f"sagemaker.aws/pipelines/view/{pipeline_name}/executions"
-                f"/{execution_id}/graph"
+            return _STUDIO_PIPELINE_EXECUTION_URL_TEMPLATE.format(
+                studio_domain_id=studio_domain_id,
+                region_name=region_name,
+                pipeline_name=pipeline_name,
+                execution_id=execution_id,
             )
 
         except Exception as e:
@@ -943,34 +1207,31 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
 
     @staticmethod
     def _compute_orchestrator_logs_url(
-        execution_arn: Any,
+        region_name: Optional[str],
+        execution_id: Optional[str],
         settings: SagemakerOrchestratorSettings,
     ) -> Optional[str]:
         """Generate the CloudWatch URL upon pipeline execution.
 
         Args:
-            execution_arn: The ARN of the pipeline execution.
+            region_name: The region of the pipeline execution.
+            execution_id: The ID of the pipeline execution.
             settings: The Sagemaker orchestrator settings.
 
         Returns:
             the URL querying the pipeline logs in CloudWatch on AWS.
         """
         try:
-            region_name, _, execution_id = dissect_pipeline_execution_arn(
-                execution_arn
-            )
-
             use_training_jobs = True
             if settings.use_training_step is not None:
                 use_training_jobs = settings.use_training_step
 
             job_type = "Training" if use_training_jobs else "Processing"
 
-            return (
-                f"https://{region_name}.console.aws.amazon.com/"
-                f"cloudwatch/home?region={region_name}#logsV2:log-groups/log-group"
-                f"/$252Faws$252Fsagemaker$252F{job_type}Jobs$3FlogStreamNameFilter"
-                f"$3Dpipelines-{execution_id}-"
+            return _CLOUDWATCH_LOGS_URL_TEMPLATE.format(
+                region_name=region_name,
+                job_type=job_type,
+                execution_id=execution_id,
             )
         except Exception as e:
             logger.warning(
@@ -1010,12 +1271,14 @@ class SagemakerOrchestrator(ContainerizedOrchestrator):
         Raises:
             ValueError: If the cron expression is invalid
         """
-        # Strip any "cron(" prefix if it exists
-        cron_exp = cron_expression.replace("cron(", "").replace(")", "")
+        # Strip the "cron(...)" wrapper if it exists
+        cron_exp = cron_expression.strip()
+        if cron_exp.startswith("cron(") and cron_exp.endswith(")"):
+            cron_exp = cron_exp[5:-1].strip()
 
         # Split into components
         parts = cron_exp.split()
-        if len(parts) not in [6, 7]:  # AWS cron requires 6 or 7 fields
+        if len(parts) not in _VALID_CRON_FIELD_COUNTS:
             raise ValueError(
                 f"Invalid cron expression: {cron_expression}. AWS cron "
                 "expressions must have 6 or 7 fields: minute hour day-of-month "
@@ -757,10 +757,11 @@ class BaseFilter(BaseModel):
             A list of filters.
         """
         list_of_filters: List[Filter] = []
+        excluded_fields = set(cls.FILTER_EXCLUDE_FIELDS)
 
         for key, value in values.items():
             # Ignore excluded filters
-            if key in cls.FILTER_EXCLUDE_FIELDS:
+            if key in excluded_fields:
                 continue
 
             # Skip filtering for None values
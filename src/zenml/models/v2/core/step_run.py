@@ -66,6 +66,28 @@ class StepRunInputResponse(ArtifactVersionResponse):
 
     input_type: StepRunInputArtifactType
 
+    @classmethod
+    def from_artifact_version(
+        cls,
+        artifact_version: ArtifactVersionResponse,
+        input_type: StepRunInputArtifactType,
+    ) -> "StepRunInputResponse":
+        """Create a step run input from an artifact version.
+
+        The artifact version is already a validated model, so its fields are
+        reused as they are instead of validating all nested models again.
+
+        Args:
+            artifact_version: The artifact version of the input.
+            input_type: The type of the input.
+
+        Returns:
+            The step run input.
+        """
+        return cls.model_construct(
+            input_type=input_type, **dict(artifact_version)
+        )
+
     def get_hydrated_version(self) -> "StepRunInputResponse":
         """Get the hydrated version of this step run input.
 
@@ -74,9 +96,9 @@ class StepRunInputResponse(ArtifactVersionResponse):
         """
         from zenml.client import Client
 
-        return StepRunInputResponse(
+        return StepRunInputResponse.from_artifact_version(
+            artifact_version=Client().zen_store.get_artifact_version(self.id),
             input_type=self.input_type,
-            **Client().zen_store.get_artifact_version(self.id).model_dump(),
         )
 
 
@@ -168,7 +190,7 @@ class StepRunUpdate(BaseUpdate):
         title="The end time of the step run.",
         default=None,
     )
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = ConfigDict(protected_namespaces=(), defer_build=True)
 
 
 # ------------------ Response Model ------------------
@@ -209,26 +231,23 @@ class StepRunResponseMetadata(ProjectScopedResponseMetadata):
     config: "StepConfiguration" = Field(title="The configuration of the step.")
     spec: "StepSpec" = Field(title="The spec of the step.")
 
-    # Code related fields
+    # Code related fields. These values were already validated when the step
+    # run was created, so there is no need to check their length again.
     cache_key: Optional[str] = Field(
         title="The cache key of the step run.",
         default=None,
-        max_length=STR_FIELD_MAX_LENGTH,
     )
     code_hash: Optional[str] = Field(
         title="The code hash of the step run.",
         default=None,
-        max_length=STR_FIELD_MAX_LENGTH,
     )
     docstring: Optional[str] = Field(
         title="The docstring of the step function or class.",
         default=None,
-        max_length=TEXT_FIELD_MAX_LENGTH,
     )
     source_code: Optional[str] = Field(
         title="The source code of the step function or class.",
         default=None,
-        max_length=TEXT_FIELD_MAX_LENGTH,
     )
 
     # References
@@ -311,16 +330,16 @@ class StepRunResponse(
         Raises:
             ValueError: If there were zero or multiple inputs to this step.
         """
-        if not self.inputs:
+        inputs = self.inputs
+        if not inputs:
             raise ValueError(f"Step {self.name} has no inputs.")
-        if len(self.inputs) > 1 or (
-            len(self.inputs) == 1 and len(next(iter(self.inputs.values()))) > 1
-        ):
+        input_artifacts = next(iter(inputs.values()))
+        if len(inputs) > 1 or len(input_artifacts) > 1:
             raise ValueError(
                 f"Step {self.name} has multiple inputs, so `Step.input` is "
                 "ambiguous. Please use `Step.inputs` instead."
             )
-        return next(iter(self.inputs.values()))[0]
+        return input_artifacts[0]
 
     @property
     def output(self) -> ArtifactVersionResponse:
@@ -332,17 +351,16 @@ class StepRunResponse(
         Raises:
             ValueError: If there were zero or multiple step outputs.
         """
-        if not self.outputs:
+        outputs = self.outputs
+        if not outputs:
             raise ValueError(f"Step {self.name} has no outputs.")
-        if len(self.outputs) > 1 or (
-            len(self.outputs) == 1
-            and len(next(iter(self.outputs.values()))) > 1
-        ):
+        output_artifacts = next(iter(outputs.values()))
+        if len(outputs) > 1 or len(output_artifacts) > 1:
             raise ValueError(
                 f"Step {self.name} has multiple outputs, so `Step.output` is "
                 "ambiguous. Please use `Step.outputs` instead."
             )
-        return next(iter(self.outputs.values()))[0]
+        return output_artifacts[0]
 
     @property
     def regular_inputs(self) -> Dict[str, StepRunInputResponse]:
@@ -665,7 +683,7 @@ class StepRunFilter(ProjectScopedFilter, RunMetadataFilterMixin):
         default=None,
         description="Name/ID of the model associated with the step run.",
     )
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = ConfigDict(protected_namespaces=(), defer_build=True)
 
     def get_custom_filters(
         self, table: Type["AnySchema"]
@@ -680,15 +698,15 @@ class StepRunFilter(ProjectScopedFilter, RunMetadataFilterMixin):
         """
         custom_filters = super().get_custom_filters(table)
 
-        from sqlmodel import and_
+        if self.model:
+            from sqlmodel import and_
 
-        from zenml.zen_stores.schemas import (
-            ModelSchema,
-            ModelVersionSchema,
-            StepRunSchema,
-        )
+            from zenml.zen_stores.schemas import (
+                ModelSchema,
+                ModelVersionSchema,
+                StepRunSchema,
+            )
 
-        if self.model:
             model_filter = and_(
                 StepRunSchema.model_version_id == ModelVersionSchema.id,
                 ModelVersionSchema.model_id == ModelSchema.id,
@@ -4779,9 +4779,11 @@ class RestZenStore(BaseZenStore):
             raise ValueError(
                 f"Bad API Response. Expected list, got {type(body)}"
             )
-        # The initial page of items will be of type BaseResponseModel
-        page_of_items: Page[AnyResponse] = Page.model_validate(body)
-        # So these items will be parsed into their correct types like here
+        # Only validate the page fields here, the items are validated into
+        # their correct type right after
+        page_of_items: Page[AnyResponse] = Page.model_validate(
+            {**body, "items": []}
+        )
         page_of_items.items = [
             response_model.model_validate(generic_item)
             for generic_item in body["items"]
@@ -359,9 +359,9 @@ class StepRunSchema(NamedSchema, RunMetadataInterface, table=True):
             for input_artifact in self.input_artifacts:
                 if input_artifact.name not in input_artifacts:
                     input_artifacts[input_artifact.name] = []
-                step_run_input = StepRunInputResponse(
+                step_run_input = StepRunInputResponse.from_artifact_version(
+                    artifact_version=input_artifact.artifact_version.to_model(),
                     input_type=StepRunInputArtifactType(input_artifact.type),
-                    **input_artifact.artifact_version.to_model().model_dump(),
                 )
                 input_artifacts[input_artifact.name].append(step_run_input)
 
@@ -12,9 +12,39 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import itertools
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
 from zenml.enums import StackComponentType
 from zenml.integrations.aws.flavors import SagemakerOrchestratorFlavor
 
+SAGEMAKER_ORCHESTRATOR_MODULE = (
+    "zenml.integrations.aws.orchestrators.sagemaker_orchestrator"
+)
+
+
+def _get_sagemaker_orchestrator(**kwargs):
+    from zenml.integrations.aws.flavors.sagemaker_orchestrator_flavor import (
+        SagemakerOrchestratorConfig,
+    )
+    from zenml.integrations.aws.orchestrators import SagemakerOrchestrator
+
+    kwargs.setdefault("execution_role", "arn:aws:iam::123456789012:role/test")
+    return SagemakerOrchestrator(
+        name="",
+        id=uuid4(),
+        config=SagemakerOrchestratorConfig(**kwargs),
+        flavor="sagemaker",
+        type=StackComponentType.ORCHESTRATOR,
+        user=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
 
 def test_sagemaker_orchestrator_flavor_attributes():
     """Tests that the basic attributes of the sagemaker orchestrator flavor are
@@ -22,3 +52,409 @@ def test_sagemaker_orchestrator_flavor_attributes():
     flavor = SagemakerOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "sagemaker"
+
+
+def test_sagemaker_orchestrator_caches_session(mocker):
+    """Tests that the sagemaker session is only created once."""
+    boto_session = mocker.patch(
+        f"{SAGEMAKER_ORCHESTRATOR_MODULE}.boto3.Session"
+    )
+    sagemaker_session = mocker.patch(
+        f"{SAGEMAKER_ORCHESTRATOR_MODULE}.Session"
+    )
+
+    orchestrator = _get_sagemaker_orchestrator()
+
+    session = orchestrator._get_sagemaker_session()
+    assert orchestrator._get_sagemaker_session() is session
+    assert boto_session.call_count == 1
+    assert sagemaker_session.call_count == 1
+
+
+def test_sagemaker_orchestrator_refreshes_expired_role_session(mocker):
+    """Tests that the sagemaker session is recreated once the assumed role
+    credentials are about to expire."""
+    orchestrator = _get_sagemaker_orchestrator(
+        aws_auth_role_arn="arn:aws:iam::123456789012:role/auth"
+    )
+    boto_session = mocker.patch(
+        f"{SAGEMAKER_ORCHESTRATOR_MODULE}.boto3.Session"
+    )
+    mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.Session")
+    boto_session.return_value.client.return_value.assume_role.return_value = {
+        "Credentials": {
+            "AccessKeyId": "key",
+            "SecretAccessKey": "secret",
+            "SessionToken": "token",
+            "Expiration": datetime.now(timezone.utc) + timedelta(minutes=1),
+        }
+    }
+
+    orchestrator._get_sagemaker_session()
+    orchestrator._get_sagemaker_session()
+    # Two `boto3.Session`s (initial + assumed role) per session creation
+    assert boto_session.call_count == 4
+
+
+def test_sagemaker_orchestrator_caches_studio_domain_id(mocker):
+    """Tests that the Studio domain is only looked up once."""
+    orchestrator = _get_sagemaker_orchestrator()
+    session = mocker.patch.object(orchestrator, "_get_sagemaker_session")
+    list_domains = session.return_value.sagemaker_client.list_domains
+    list_domains.return_value = {"Domains": [{"DomainId": "d-123"}]}
+    execution = {
+        "region_name": "us-east-1",
+        "pipeline_name": "my-pipeline",
+        "execution_id": "abc123",
+    }
+
+    url = orchestrator._compute_orchestrator_url(**execution)
+    assert url == orchestrator._compute_orchestrator_url(**execution)
+    assert url.startswith("https://studio-d-123.studio.us-east-1.")
+    assert list_domains.call_count == 1
+
+
+def test_sagemaker_orchestrator_metadata_without_urls(mocker):
+    """Tests that the URLs can be excluded from the run metadata without
+    calling the AWS API."""
+    from zenml.integrations.aws.flavors.sagemaker_orchestrator_flavor import (
+        SagemakerOrchestratorSettings,
+    )
+
+    orchestrator = _get_sagemaker_orchestrator()
+    session = mocker.patch.object(orchestrator, "_get_sagemaker_session")
+    execution_arn = (
+        "arn:aws:sagemaker:us-east-1:123456789012:pipeline/my-pipeline"
+        "/execution/abc123"
+    )
+
+    metadata = next(
+        orchestrator.compute_metadata(
+            execution_arn=execution_arn,
+            settings=SagemakerOrchestratorSettings(
+                include_studio_url=False, include_logs_url=False
+            ),
+        )
+    )
+
+    assert metadata["pipeline_execution_arn"] == execution_arn
+    assert len(metadata) == 2
+    session.return_value.sagemaker_client.list_domains.assert_not_called()
+
+
+def test_dissect_pipeline_execution_arn():
+    """Tests that pipeline execution ARNs are split into their parts."""
+    from zenml.integrations.aws.orchestrators.sagemaker_orchestrator import (
+        dissect_pipeline_execution_arn,
+    )
+
+    assert dissect_pipeline_execution_arn(
+        "arn:aws:sagemaker:us-east-1:123456789012:pipeline/my-pipeline"
+        "/execution/abc123"
+    ) == ("us-east-1", "my-pipeline", "abc123")
+    assert dissect_pipeline_execution_arn("not-an-arn") == (None, None, None)
+
+
+def test_dissect_schedule_arn():
+    """Tests that EventBridge schedule ARNs are split into their parts."""
+    from zenml.integrations.aws.orchestrators.sagemaker_orchestrator import (
+        dissect_schedule_arn,
+    )
+
+    assert dissect_schedule_arn(
+        "arn:aws:scheduler:eu-west-1:123456789012:schedule/default/my-schedule"
+    ) == ("eu-west-1", "default/my-schedule")
+
+    with pytest.raises(ValueError):
+        dissect_schedule_arn(
+            "arn:aws:scheduler:eu-west-1:123456789012:rule/my-rule"
+        )
+
+
+def test_sagemaker_orchestrator_builds_steps_in_order(mocker):
+    """Tests that the SageMaker steps are built in the order of the step
+    configurations and that step environments don't leak into other steps."""
+    from zenml.integrations.aws.flavors.sagemaker_orchestrator_flavor import (
+        SagemakerOrchestratorSettings,
+    )
+
+    orchestrator = _get_sagemaker_orchestrator()
+    mocker.patch.object(orchestrator, "_get_sagemaker_session")
+    mocker.patch.object(orchestrator, "get_image", return_value="image")
+    # The steps are built concurrently, so we identify each built step by
+    # its name instead of relying on the order of the calls
+    mocker.patch(
+        f"{SAGEMAKER_ORCHESTRATOR_MODULE}.TrainingStep",
+        side_effect=lambda **kwargs: kwargs["name"],
+    )
+    estimator = mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.Estimator")
+    pipeline = mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.Pipeline")
+
+    step_names = [f"step_{i}" for i in range(10)]
+    deployment = mocker.MagicMock(id=uuid4(), schedule=None)
+    deployment.pipeline_configuration.name = "pipeline"
+    deployment.step_configurations = {
+        step_name: mocker.MagicMock() for step_name in step_names
+    }
+    step_settings = {
+        id(step): SagemakerOrchestratorSettings(
+            synchronous=False,
+            environment={"STEP_NAME": step_name}
+            if step_name == "step_0"
+            else {},
+        )
+        for step_name, step in deployment.step_configurations.items()
+    }
+    mocker.patch.object(
+        orchestrator,
+        "get_settings",
+        side_effect=lambda container: step_settings.get(
+            id(container), SagemakerOrchestratorSettings(synchronous=False)
+        ),
+    )
+
+    list(
+        orchestrator.prepare_or_run_pipeline(
+            deployment=deployment, stack=mocker.MagicMock(), environment={}
+        )
+    )
+
+    assert pipeline.call_args.kwargs["steps"] == step_names
+    environments = [
+        call.kwargs["environment"] for call in estimator.call_args_list
+    ]
+    assert sum("STEP_NAME" in environment for environment in environments) == 1
+
+
+def test_sagemaker_orchestrator_validates_shared_step_settings_once(mocker):
+    """Tests that steps with the same settings only validate them once."""
+    from zenml.integrations.aws.flavors.sagemaker_orchestrator_flavor import (
+        SagemakerOrchestratorSettings,
+    )
+    from zenml.utils import settings_utils
+
+    orchestrator = _get_sagemaker_orchestrator()
+    mocker.patch.object(orchestrator, "_get_sagemaker_session")
+    mocker.patch.object(orchestrator, "get_image", return_value="image")
+    mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.TrainingStep")
+    mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.Estimator")
+    mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.Pipeline")
+
+    settings_key = settings_utils.get_stack_component_setting_key(orchestrator)
+    deployment = mocker.MagicMock(id=uuid4(), schedule=None)
+    deployment.pipeline_configuration.name = "pipeline"
+    deployment.step_configurations = {}
+    for i in range(20):
+        step = mocker.MagicMock()
+        step.config.settings = {
+            settings_key: SagemakerOrchestratorSettings(
+                instance_type="ml.m5.large" if i % 2 else "ml.m5.xlarge"
+            )
+        }
+        deployment.step_configurations[f"step_{i}"] = step
+
+    def _get_settings(container):
+        if container is deployment:
+            return SagemakerOrchestratorSettings(synchronous=False)
+        # Validating the settings takes a while, which would make concurrent
+        # builder threads miss a shared cache
+        time.sleep(0.005)
+        return container.config.settings[settings_key]
+
+    get_settings = mocker.patch.object(
+        orchestrator, "get_settings", side_effect=_get_settings
+    )
+
+    list(
+        orchestrator.prepare_or_run_pipeline(
+            deployment=deployment, stack=mocker.MagicMock(), environment={}
+        )
+    )
+
+    step_calls = [
+        call
+        for call in get_settings.call_args_list
+        if call.args[0] is not deployment
+    ]
+    assert len(step_calls) == 2
+
+
+def test_sagemaker_orchestrator_converts_network_configs_by_content(mocker):
+    """Tests that each step gets the network config of its own settings."""
+    from zenml.integrations.aws.flavors.sagemaker_orchestrator_flavor import (
+        SagemakerOrchestratorSettings,
+    )
+
+    orchestrator = _get_sagemaker_orchestrator()
+    mocker.patch.object(orchestrator, "_get_sagemaker_session")
+    mocker.patch.object(orchestrator, "get_image", return_value="image")
+    mocker.patch(
+        f"{SAGEMAKER_ORCHESTRATOR_MODULE}.TrainingStep",
+        side_effect=lambda **kwargs: kwargs["estimator"],
+    )
+    mocker.patch(
+        f"{SAGEMAKER_ORCHESTRATOR_MODULE}.Estimator",
+        side_effect=lambda **kwargs: kwargs.get("network_config"),
+    )
+    pipeline = mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.Pipeline")
+
+    deployment = mocker.MagicMock(id=uuid4(), schedule=None)
+    deployment.pipeline_configuration.name = "pipeline"
+    deployment.step_configurations = {
+        f"step_{i}": mocker.MagicMock() for i in range(6)
+    }
+    step_subnets = {
+        id(step): [f"subnet-{i % 3}"]
+        for i, step in enumerate(deployment.step_configurations.values())
+    }
+    mocker.patch.object(
+        orchestrator,
+        "get_settings",
+        side_effect=lambda container: SagemakerOrchestratorSettings(
+            synchronous=False,
+            estimator_args={
+                "network_config": {"subnets": step_subnets[id(container)]}
+            }
+            if id(container) in step_subnets
+            else {},
+        ),
+    )
+
+    list(
+        orchestrator.prepare_or_run_pipeline(
+            deployment=deployment, stack=mocker.MagicMock(), environment={}
+        )
+    )
+
+    network_configs = pipeline.call_args.kwargs["steps"]
+    assert [config.subnets for config in network_configs] == [
+        ["subnet-0"],
+        ["subnet-1"],
+        ["subnet-2"],
+        ["subnet-0"],
+        ["subnet-1"],
+        ["subnet-2"],
+    ]
+    assert network_configs[0] is network_configs[3]
+    assert network_configs[0] is not network_configs[1]
+
+
+def test_sagemaker_orchestrator_waits_with_exponential_backoff(mocker):
+    """Tests that the pipeline execution status is polled with a growing
+    delay until it reaches a terminal status."""
+    from zenml.integrations.aws.flavors.sagemaker_orchestrator_flavor import (
+        SagemakerOrchestratorSettings,
+    )
+
+    orchestrator = _get_sagemaker_orchestrator()
+    session = mocker.patch.object(orchestrator, "_get_sagemaker_session")
+    session.return_value.sagemaker_client.describe_pipeline_execution.side_effect = [
+        {"PipelineExecutionStatus": "Executing"},
+        {"PipelineExecutionStatus": "Executing"},
+        {"PipelineExecutionStatus": "Executing"},
+        {"PipelineExecutionStatus": "Succeeded"},
+    ]
+    sleep = mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.time.sleep")
+
+    status = orchestrator._wait_for_pipeline_execution(
+        execution_arn="arn",
+        settings=SagemakerOrchestratorSettings(polling_max_delay_in_seconds=5),
+    )
+
+    assert status == "Succeeded"
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert len(delays) == 3
+    assert delays[0] <= 2
+    assert all(delay <= 5 for delay in delays)
+
+
+def test_sagemaker_orchestrator_wait_uses_configured_backoff(mocker):
+    """Tests that the polling backoff can be configured in the settings."""
+    from zenml.integrations.aws.flavors.sagemaker_orchestrator_flavor import (
+        SagemakerOrchestratorSettings,
+    )
+
+    orchestrator = _get_sagemaker_orchestrator()
+    session = mocker.patch.object(orchestrator, "_get_sagemaker_session")
+    session.return_value.sagemaker_client.describe_pipeline_execution.side_effect = [
+        {"PipelineExecutionStatus": "Executing"},
+        {"PipelineExecutionStatus": "Executing"},
+        {"PipelineExecutionStatus": "Executing"},
+        {"PipelineExecutionStatus": "Stopped"},
+    ]
+    sleep = mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.time.sleep")
+
+    status = orchestrator._wait_for_pipeline_execution(
+        execution_arn="arn",
+        settings=SagemakerOrchestratorSettings(
+            polling_initial_delay_in_seconds=1,
+            polling_backoff_base=3,
+        ),
+    )
+
+    assert status == "Stopped"
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert [0.5 <= delay <= 1 for delay in delays] == [True, False, False]
+    assert 1.5 <= delays[1] <= 3
+    assert 4.5 <= delays[2] <= 9
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"polling_initial_delay_in_seconds": 0},
+        {"polling_backoff_base": 0.5},
+        {"polling_max_delay_in_seconds": 0},
+        {"polling_timeout_in_seconds": -1},
+    ],
+)
+def test_sagemaker_orchestrator_rejects_invalid_polling_settings(settings):
+    """Tests that polling settings which would busy-loop are rejected."""
+    from pydantic import ValidationError
+
+    from zenml.integrations.aws.flavors.sagemaker_orchestrator_flavor import (
+        SagemakerOrchestratorSettings,
+    )
+
+    with pytest.raises(ValidationError):
+        SagemakerOrchestratorSettings(**settings)
+
+
+def test_sagemaker_orchestrator_wait_times_out(mocker):
+    """Tests that waiting for a pipeline execution fails after the timeout."""
+    from zenml.integrations.aws.flavors.sagemaker_orchestrator_flavor import (
+        SagemakerOrchestratorSettings,
+    )
+
+    orchestrator = _get_sagemaker_orchestrator()
+    session = mocker.patch.object(orchestrator, "_get_sagemaker_session")
+    session.return_value.sagemaker_client.describe_pipeline_execution.return_value = {
+        "PipelineExecutionStatus": "Executing"
+    }
+    mocker.patch(f"{SAGEMAKER_ORCHESTRATOR_MODULE}.time.sleep")
+    mocker.patch(
+        f"{SAGEMAKER_ORCHESTRATOR_MODULE}.time.monotonic",
+        side_effect=itertools.count(step=5),
+    )
+
+    with pytest.raises(RuntimeError):
+        orchestrator._wait_for_pipeline_execution(
+            execution_arn="arn",
+            settings=SagemakerOrchestratorSettings(
+                polling_timeout_in_seconds=10
+            ),
+        )
+
+
+def test_validate_cron_expression():
+    """Tests that cron expressions are unwrapped and validated."""
+    from zenml.integrations.aws.orchestrators import SagemakerOrchestrator
+
+    validate = SagemakerOrchestrator._validate_cron_expression
+    assert validate("cron(15 10 ? * 6L 2022-2023)") == "15 10 ? * 6L 2022-2023"
+    assert validate("0 12 * * ? *") == "0 12 * * ? *"
+    assert validate("cron(0 12 * * ? *) ") == "0 12 * * ? *"
+    assert validate(" cron( 0 12 * * ? * )") == "0 12 * * ? *"
+
+    with pytest.raises(ValueError):
+        validate("cron(0 12 * *)")
@@ -0,0 +1,45 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import pickle
+
+from zenml.models import Page, UserFilter, UserResponse
+from zenml.zen_stores.rest_zen_store import RestZenStore
+
+
+def test_list_paginated_resources_validates_items(mocker, sample_user_model):
+    """Test that listed resources are validated into the response model."""
+    store = mocker.MagicMock()
+    store.get.return_value = {
+        "index": 1,
+        "max_size": 20,
+        "total_pages": 1,
+        "total": 1,
+        "items": [sample_user_model.model_dump(mode="json")],
+    }
+
+    page = RestZenStore._list_paginated_resources(
+        store,
+        route="/users",
+        response_model=UserResponse,
+        filter_model=UserFilter(),
+    )
+
+    assert type(page) is Page
+    assert page.total == 1
+    assert page.items == [sample_user_model]
+    assert isinstance(page.items[0], UserResponse)
+    # Pages returned by the REST store can be pickled like the ones
+    # returned by the SQL store
+    assert pickle.loads(pickle.dumps(page)).items == page.items